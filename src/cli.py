@@ -2,64 +2,104 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import asdict
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
+from src.metrics import METRICS
+
+if TYPE_CHECKING:
+    from src.models.name_index import NameIndex
+    from src.scraper.async_client import AsyncRealmEyeClient
+    from src.scraper.realmeye_client import RealmEyeClient
 
-from src.models.schema import (
-    RequirementsDataset,
-    requirement_rule_from_config,
-    validate_requirements_config,
-)
-from src.scraper.assets import download_assets, validate_assets
-from src.scraper.classes import CLASSES_PATH, parse_classes_html
-from src.scraper.items import CATEGORY_PATHS, ITEMS_PATH, parse_items_html
-from src.scraper.realmeye_client import RealmEyeClient
 
 ROOT = Path(__file__).resolve().parents[1]
 RAW_DIR = ROOT / "data" / "raw"
 NORMALIZED_DIR = ROOT / "data" / "normalized"
+SHARDS_DIR = NORMALIZED_DIR / "shards"
 CONFIG_PATH = ROOT / "config" / "requirements-sheet.yaml"
 
 
 def scrape_classes(client: RealmEyeClient) -> list[dict]:
-    html = client.fetch(CLASSES_PATH)
+    from src.scraper.classes import CLASSES_PATH
+
+    return _store_classes(client.fetch(CLASSES_PATH), client.base_url)
+
+
+async def scrape_classes_async(client: AsyncRealmEyeClient) -> list[dict]:
+    from src.scraper.classes import CLASSES_PATH
+
+    return _store_classes(await client.fetch(CLASSES_PATH), client.base_url)
+
+
+def scrape_items(client: RealmEyeClient) -> list[dict]:
+    from src.scraper.items import ITEMS_PATH
+
+    index_html = client.fetch(ITEMS_PATH)
+    category_paths = _category_paths(index_html)
+    category_pages = {path: client.fetch(path) for path in category_paths}
+    return _store_items(index_html, category_pages, client.base_url)
+
+
+async def scrape_items_async(client: AsyncRealmEyeClient, concurrency: int | None = None) -> list[dict]:
+    from src.scraper.items import ITEMS_PATH
+
+    index_html = await client.fetch(ITEMS_PATH)
+    category_paths = _category_paths(index_html)
+    category_pages = dict(zip(category_paths, await client.fetch_many(category_paths, concurrency)))
+    return _store_items(index_html, category_pages, client.base_url)
+
+
+def _store_classes(html: str, base_url: str) -> list[dict]:
+    from dataclasses import asdict
+
+    from src.models.changelog import write_records_with_changelog
+    from src.scraper.classes import parse_classes_html
+
     RAW_DIR.mkdir(parents=True, exist_ok=True)
     (RAW_DIR / "classes.html").write_text(html, encoding="utf-8")
 
-    classes = parse_classes_html(html, client.base_url)
+    classes = parse_classes_html(html, base_url)
     payload = [asdict(record) for record in classes]
-    (NORMALIZED_DIR / "classes.json").parent.mkdir(parents=True, exist_ok=True)
-    (NORMALIZED_DIR / "classes.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_records_with_changelog(NORMALIZED_DIR / "classes.json", payload)
     return payload
 
 
-def scrape_items(client: RealmEyeClient) -> list[dict]:
-    RAW_DIR.mkdir(parents=True, exist_ok=True)
-
-    index_html = client.fetch(ITEMS_PATH)
-    (RAW_DIR / "items-index.html").write_text(index_html, encoding="utf-8")
+def _category_paths(index_html: str) -> list[str]:
+    from src.scraper.items import CATEGORY_PATHS
 
-    records_by_id: dict[str, dict] = {}
     category_paths = [path for path in CATEGORY_PATHS if path in index_html]
     if not category_paths:
         category_paths = list(CATEGORY_PATHS.keys())
+    return category_paths
+
 
-    for path in category_paths:
-        category_html = client.fetch(path)
+def _store_items(index_html: str, category_pages: dict[str, str], base_url: str) -> list[dict]:
+    from dataclasses import asdict
+
+    from src.models.changelog import write_records_with_changelog
+    from src.scraper.items import CATEGORY_PATHS, parse_items_html
+
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    (RAW_DIR / "items-index.html").write_text(index_html, encoding="utf-8")
+
+    records_by_id: dict[str, dict] = {}
+    for path, category_html in category_pages.items():
         slug = path.removeprefix('/wiki/')
         (RAW_DIR / f"items-{slug}.html").write_text(category_html, encoding="utf-8")
-        parsed = parse_items_html(category_html, client.base_url, default_item_type=CATEGORY_PATHS[path])
+        parsed = parse_items_html(category_html, base_url, default_item_type=CATEGORY_PATHS[path])
         for record in parsed:
             records_by_id[record.id] = asdict(record)
 
     payload = sorted(records_by_id.values(), key=lambda row: row["name"].lower())
-    (NORMALIZED_DIR / "items.json").parent.mkdir(parents=True, exist_ok=True)
-    (NORMALIZED_DIR / "items.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_records_with_changelog(NORMALIZED_DIR / "items.json", payload)
     return payload
 
 
 def load_requirements() -> list:
+    from src.models.schema import requirement_rule_from_config, validate_requirements_config
+
     config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
     errors = validate_requirements_config(config)
     if errors:
@@ -67,7 +107,33 @@ def load_requirements() -> list:
     return [requirement_rule_from_config(rule) for rule in config["requirements"]]
 
 
-def build_dataset() -> dict:
+def load_name_index() -> NameIndex:
+    """Load the persisted name index, syncing it first if the catalogs changed."""
+
+    from src.models.changelog import file_sha256
+    from src.models.name_index import NameIndex
+
+    index_path = NORMALIZED_DIR / "name-index.json"
+    sources = {name: file_sha256(NORMALIZED_DIR / name) for name in ("items.json", "classes.json")}
+    try:
+        index = NameIndex.load(index_path) if index_path.exists() else NameIndex()
+    except ValueError:
+        # Written by an older index version; rebuild it from the catalogs.
+        index = NameIndex()
+    if index.sources != sources:
+        items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
+        classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
+        index.sync(items, classes)
+        index.sources = sources
+        index.save(index_path)
+    return index
+
+
+def build_dataset(shards: bool = False, changed_only: bool = False) -> dict:
+    from src.models.changelog import file_sha256
+    from src.models.schema import RequirementsDataset
+    from src.models.shards import write_dataset_shards
+
     classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
     items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
     assets = json.loads((NORMALIZED_DIR / "assets.json").read_text(encoding="utf-8"))
@@ -79,11 +145,65 @@ def build_dataset() -> dict:
         assets=[_dc_from_dict("asset", row) for row in assets],
         requirements=load_requirements(),
     )
-    payload = dataset.to_dict()
-    (NORMALIZED_DIR / "requirements-dataset.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if changed_only:
+        # Delta builds only refresh the shards touched since the last build;
+        # the monolithic document would need a full re-serialization.
+        inputs = {name: file_sha256(NORMALIZED_DIR / name) for name in ("classes.json", "items.json", "assets.json")}
+        with METRICS.timer("dataset.shards_s"):
+            return write_dataset_shards(dataset, SHARDS_DIR, _affected_shard_keys(items, inputs), inputs)
+
+    with METRICS.timer("dataset.serialize_s"):
+        payload = dataset.to_dict()
+        (NORMALIZED_DIR / "requirements-dataset.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if shards:
+        inputs = {name: file_sha256(NORMALIZED_DIR / name) for name in ("classes.json", "items.json", "assets.json")}
+        with METRICS.timer("dataset.shards_s"):
+            return write_dataset_shards(dataset, SHARDS_DIR, inputs=inputs)
     return payload
 
 
+def _affected_shard_keys(items: list[dict], inputs: dict[str, str | None]) -> set[str] | None:
+    """Shard keys touched since the last sharded build, or None if unknown.
+
+    A changelog only describes the delta from the build's inputs when its
+    ``previous_sha256`` matches the hash recorded in the shard manifest.
+    """
+
+    from src.models.changelog import load_changelog
+    from src.models.shards import CORE_SHARD_KEY, load_manifest, shard_key
+
+    built_from = load_manifest(SHARDS_DIR).get("inputs", {})
+    items_by_id = {row["id"]: row for row in items}
+    keys = {CORE_SHARD_KEY}
+
+    for name in ("items.json", "assets.json"):
+        if name in built_from and built_from[name] == inputs[name]:
+            continue
+        changelog = load_changelog(NORMALIZED_DIR / name)
+        if (
+            changelog is None
+            or changelog["previous_sha256"] != built_from.get(name)
+            or changelog["current_sha256"] != inputs[name]
+        ):
+            return None
+
+        for record_id in [*changelog["added"], *changelog["changed"], *changelog["removed"]]:
+            row = items_by_id.get(record_id)
+            if row is not None:
+                keys.add(shard_key(row["item_type"], row["tier"]))
+        for record_id, fields in changelog["changed"].items():
+            if record_id in items_by_id and ("item_type" in fields or "tier" in fields):
+                row = items_by_id[record_id]
+                old_type = fields["item_type"][0] if "item_type" in fields else row["item_type"]
+                old_tier = fields["tier"][0] if "tier" in fields else row["tier"]
+                keys.add(shard_key(old_type, old_tier))
+        for row in changelog["removed"].values():
+            if "item_type" in row:
+                keys.add(shard_key(row["item_type"], row["tier"]))
+
+    return keys
+
+
 def _dc_from_dict(kind: str, row: dict):
     from src.models.schema import AssetRecord, ClassRecord, ItemRecord
 
@@ -96,48 +216,254 @@ def _dc_from_dict(kind: str, row: dict):
     raise ValueError(f"Unknown kind {kind}")
 
 
-def main() -> None:
+def _cmd_scrape_classes(args: argparse.Namespace) -> None:
+    if args.use_async:
+        import asyncio
+
+        payload = asyncio.run(scrape_classes_async(_async_client(args)))
+    else:
+        payload = scrape_classes(_client())
+    print(json.dumps(payload, indent=2))
+
+
+def _cmd_scrape_items(args: argparse.Namespace) -> None:
+    if args.use_async:
+        import asyncio
+
+        payload = asyncio.run(scrape_items_async(_async_client(args)))
+    else:
+        payload = scrape_items(_client())
+    print(json.dumps(payload, indent=2))
+
+
+def _cmd_download_assets(args: argparse.Namespace) -> None:
+    from dataclasses import asdict
+
+    from src.models.changelog import file_sha256, write_records_with_changelog
+    from src.models.schema import AssetRecord
+    from src.scraper.assets import records_needing_download
+
+    classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
+    items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
+    records = classes + items
+    inputs = {name: file_sha256(NORMALIZED_DIR / name) for name in ("classes.json", "items.json")}
+
+    existing: list[AssetRecord] = []
+    to_download = records
+    if args.changed_only and (NORMALIZED_DIR / "assets.json").exists():
+        assets_raw = json.loads((NORMALIZED_DIR / "assets.json").read_text(encoding="utf-8"))
+        existing = [AssetRecord(**row) for row in assets_raw]
+        to_download = records_needing_download(records, existing, _unapplied_changed_ids(inputs))
+
+    if args.use_async:
+        import asyncio
+
+        from src.scraper.assets import download_assets_async
+
+        downloaded = asyncio.run(download_assets_async(to_download, ROOT / "src" / "assets", _async_client(args)))
+    else:
+        from src.scraper.assets import download_assets
+
+        downloaded = download_assets(to_download, ROOT / "src" / "assets")
+
+    # Merge in catalog order; assets for removed records are dropped.
+    by_id = {asset.id: asset for asset in [*existing, *downloaded]}
+    payload = [asdict(by_id[record["id"]]) for record in records if record["id"] in by_id]
+    write_records_with_changelog(NORMALIZED_DIR / "assets.json", payload)
+    (NORMALIZED_DIR / "assets.inputs.json").write_text(json.dumps(inputs, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+def _unapplied_changed_ids(inputs: dict[str, str | None]) -> set[str]:
+    """Changed ids from scrape changelogs not yet applied to assets.json.
+
+    ``assets.inputs.json`` records the catalog hashes assets were last built
+    from; a changelog whose ``current_sha256`` matches has been consumed.
+    """
+
+    from src.models.changelog import changed_ids, load_changelog
+
+    inputs_path = NORMALIZED_DIR / "assets.inputs.json"
+    built_from = json.loads(inputs_path.read_text(encoding="utf-8")) if inputs_path.exists() else {}
+    ids: set[str] = set()
+    for name, sha256 in inputs.items():
+        if built_from.get(name) == sha256:
+            continue
+        changelog = load_changelog(NORMALIZED_DIR / name)
+        if changelog is not None and changelog["current_sha256"] == sha256:
+            ids |= changed_ids(changelog)
+    return ids
+
+
+def _cmd_validate_assets(args: argparse.Namespace) -> None:
+    from src.models.schema import AssetRecord
+    from src.scraper.assets import validate_assets
+
+    classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
+    items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
+    assets_raw = json.loads((NORMALIZED_DIR / "assets.json").read_text(encoding="utf-8"))
+
+    assets = [AssetRecord(**row) for row in assets_raw]
+    report = validate_assets(classes + items, assets, NORMALIZED_DIR / "asset-validation.json")
+    print(json.dumps(report, indent=2))
+
+
+def _cmd_build_dataset(args: argparse.Namespace) -> None:
+    print(json.dumps(build_dataset(shards=args.shards, changed_only=args.changed_only), indent=2))
+
+
+def _cmd_crawl_details(args: argparse.Namespace) -> None:
+    from dataclasses import asdict
+
+    from src.scraper.crawler import ItemDetailCrawler
+
+    items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
+    crawler = ItemDetailCrawler(client=_client(), checkpoint_path=args.checkpoint, workers=args.workers)
+    payload = [asdict(record) for record in crawler.crawl(items)]
+    (NORMALIZED_DIR / "item-details.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(json.dumps(payload, indent=2))
+
+
+def _cmd_resolve(args: argparse.Namespace) -> None:
+    from dataclasses import asdict
+
+    index = load_name_index()
+    candidates = index.resolve(args.query, limit=args.limit, kind=args.kind)
+    print(json.dumps([asdict(candidate) for candidate in candidates], indent=2))
+
+
+def _cmd_reparse(args: argparse.Namespace) -> None:
+    from src.scraper.reparse import reparse_snapshots
+
+    report = reparse_snapshots(sorted(args.raw_dir.rglob("*.html")), workers=args.workers)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    summary = {key: report[key] for key in ("workers", "elapsed_s", "files", "failures")}
+    summary["items"] = len(report["items"])
+    summary["classes"] = len(report["classes"])
+    print(json.dumps(summary, indent=2))
+    if report["failures"]:
+        raise SystemExit(f"{len(report['failures'])} snapshot(s) failed to parse")
+
+
+def _configure_reparse(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--raw-dir", type=Path, default=RAW_DIR, help="snapshot archive to scan recursively")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=NORMALIZED_DIR / "reparse-report.json",
+        help="where to write merged records and per-file timings",
+    )
+
+
+def _configure_resolve(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("query", help="item or class name, slug or id fragment")
+    parser.add_argument("--kind", choices=["item", "class"], help="restrict results to items or classes")
+    parser.add_argument("--limit", type=int, default=10, help="max candidates to print (default: 10)")
+
+
+def _configure_crawl_details(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--workers", type=int, default=4, help="concurrent page fetches (default: 4)")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=NORMALIZED_DIR / "item-details.checkpoint.json",
+        help="progress file used to resume an interrupted crawl",
+    )
+
+
+def _configure_build_dataset(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--shards",
+        action="store_true",
+        help="also write per item_type/tier shards and a manifest to data/normalized/shards",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="only rewrite shards touched by the latest items/assets changelogs (skips the monolithic file)",
+    )
+
+
+def _configure_download_assets(parser: argparse.ArgumentParser) -> None:
+    _configure_async(parser)
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="only download icons for records that are new, changed, or missing an asset",
+    )
+
+
+def _configure_async(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="fetch with the asyncio client instead of blocking requests",
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="max in-flight requests with --async (default: 16)")
+
+
+def _client() -> RealmEyeClient:
+    from src.scraper.realmeye_client import RealmEyeClient
+
+    return RealmEyeClient()
+
+
+def _async_client(args: argparse.Namespace) -> AsyncRealmEyeClient:
+    from src.scraper.async_client import AsyncRealmEyeClient
+
+    return AsyncRealmEyeClient(max_concurrency=args.concurrency)
+
+
+# name -> (handler, optional argument configurator). Handlers import the
+# scraper/schema modules they need on first use, so short commands such as
+# validate-assets don't pay for the network stack.
+COMMANDS: dict[str, tuple[Callable[[argparse.Namespace], None], Callable[[argparse.ArgumentParser], None] | None]] = {
+    "scrape-classes": (_cmd_scrape_classes, _configure_async),
+    "scrape-items": (_cmd_scrape_items, _configure_async),
+    "download-assets": (_cmd_download_assets, _configure_download_assets),
+    "validate-assets": (_cmd_validate_assets, None),
+    "build-dataset": (_cmd_build_dataset, _configure_build_dataset),
+    "crawl-details": (_cmd_crawl_details, _configure_crawl_details),
+    "resolve": (_cmd_resolve, _configure_resolve),
+    "reparse": (_cmd_reparse, _configure_reparse),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Realm requirements sheet pipeline")
+    parser.add_argument("--metrics-out", type=Path, help="write timers/counters/histograms as JSON to this path")
+    parser.add_argument("--profile", type=Path, help="run the command under cProfile and write stats to this path")
     sub = parser.add_subparsers(dest="command", required=True)
-    sub.add_parser("scrape-classes")
-    sub.add_parser("scrape-items")
-    sub.add_parser("download-assets")
-    sub.add_parser("validate-assets")
-    sub.add_parser("build-dataset")
-
-    args = parser.parse_args()
-    client = RealmEyeClient()
-
-    if args.command == "scrape-classes":
-        print(json.dumps(scrape_classes(client), indent=2))
-        return
-    if args.command == "scrape-items":
-        print(json.dumps(scrape_items(client), indent=2))
-        return
-
-    if args.command == "download-assets":
-        classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
-        items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
-        assets = download_assets(classes + items, ROOT / "src" / "assets")
-        payload = [asdict(asset) for asset in assets]
-        (NORMALIZED_DIR / "assets.json").write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        print(json.dumps(payload, indent=2))
-        return
+    for name, (handler, configure) in COMMANDS.items():
+        command_parser = sub.add_parser(name)
+        command_parser.set_defaults(handler=handler)
+        if configure is not None:
+            configure(command_parser)
+    return parser
 
-    if args.command == "validate-assets":
-        classes = json.loads((NORMALIZED_DIR / "classes.json").read_text(encoding="utf-8"))
-        items = json.loads((NORMALIZED_DIR / "items.json").read_text(encoding="utf-8"))
-        assets_raw = json.loads((NORMALIZED_DIR / "assets.json").read_text(encoding="utf-8"))
-        from src.models.schema import AssetRecord
 
-        assets = [AssetRecord(**row) for row in assets_raw]
-        report = validate_assets(classes + items, assets, NORMALIZED_DIR / "asset-validation.json")
-        print(json.dumps(report, indent=2))
-        return
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.metrics_out:
+        METRICS.enable()
+
+    profile = nullcontext()
+    if args.profile:
+        from src.metrics import profile_to
+
+        profile = profile_to(args.profile)
 
-    if args.command == "build-dataset":
-        print(json.dumps(build_dataset(), indent=2))
-        return
+    try:
+        with profile:
+            with METRICS.timer(f"command.{args.command}_s"):
+                args.handler(args)
+    finally:
+        if args.metrics_out:
+            METRICS.write_json(args.metrics_out)
 
 
 if __name__ == "__main__":
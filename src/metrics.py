@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+
+class MetricsRegistry:
+    """Process-wide timers, counters and histograms.
+
+    Recording is a no-op until ``enable()`` is called, so instrumented hot
+    paths only pay for an attribute check when metrics are off.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._counters: dict[str, float] = {}
+        self._histograms: dict[str, list[float]] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._histograms.clear()
+
+    def incr(self, name: str, value: float = 1) -> None:
+        if not self.enabled:
+            return
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        if not self.enabled:
+            return
+        self._histograms.setdefault(name, []).append(value)
+
+    def timer(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "counters": dict(sorted(self._counters.items())),
+            "histograms": {name: _summarize(values) for name, values in sorted(self._histograms.items())},
+        }
+
+    def write_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+
+
+METRICS = MetricsRegistry()
+
+
+@contextmanager
+def profile_to(path: Path) -> Iterator[None]:
+    """Run the wrapped block under cProfile and dump stats to ``path``."""
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+
+
+def _summarize(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    count = len(ordered)
+    return {
+        "count": count,
+        "sum": sum(ordered),
+        "min": ordered[0],
+        "max": ordered[-1],
+        "p50": ordered[(count - 1) // 2],
+        "p95": ordered[min(count - 1, int(count * 0.95))],
+    }
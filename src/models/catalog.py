@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Any, Iterable, Iterator
+
+from src.models.schema import ItemRecord
+
+# Filter sentinel meaning "any value"; ``None`` is itself a valid type/tier.
+_ANY: Any = object()
+
+
+class _PackedStrings:
+    """Immutable string column: one joined ``str`` plus an offsets array.
+
+    Costs roughly one byte per character and four bytes per value, instead
+    of a full ``str`` object and a list slot per value.
+    """
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self, values: Iterable[str]) -> None:
+        pieces: list[str] = []
+        offsets = array("I", [0])
+        total = 0
+        for value in values:
+            pieces.append(value)
+            total += len(value)
+            offsets.append(total)
+        self._data = "".join(pieces)
+        self._offsets = offsets
+
+    def __getitem__(self, index: int) -> str:
+        return self._data[self._offsets[index] : self._offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class _Categories:
+    """Interned categorical column: distinct values plus a compact code array."""
+
+    __slots__ = ("values", "codes", "rows_by_code")
+
+    def __init__(self, column: Iterable[str | None]) -> None:
+        self.values: list[str | None] = []
+        self.codes = array("H")
+        lookup: dict[str | None, int] = {}
+        for value in column:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.values)
+                self.values.append(sys.intern(value) if value is not None else None)
+            self.codes.append(code)
+        self.rows_by_code: list[array] = [array("I") for _ in self.values]
+        for row, code in enumerate(self.codes):
+            self.rows_by_code[code].append(row)
+
+    def rows(self, value: str | None) -> array:
+        try:
+            return self.rows_by_code[self.values.index(value)]
+        except ValueError:
+            return array("I")
+
+
+class ItemCatalog:
+    """Columnar, read-only view over a large set of ``ItemRecord`` rows.
+
+    URLs under ``base_url`` are stored as deduplicated relative paths (tiered
+    ring bundles share one icon and page), ``item_type``/``tier`` are interned
+    categorical codes, and ``filter`` answers type/tier queries from per-value
+    row indexes. ``record()``/iteration materialize ``ItemRecord`` objects.
+    """
+
+    def __init__(self, records: Iterable[ItemRecord], base_url: str = "https://www.realmeye.com") -> None:
+        self.base_url = base_url
+        rows = list(records)
+        path_codes: dict[str, int] = {}
+        paths: list[str] = []
+
+        def encode_url(url: str) -> int:
+            path = url[len(base_url) :] if url.startswith(f"{base_url}/") else url
+            code = path_codes.get(path)
+            if code is None:
+                code = path_codes[path] = len(paths)
+                paths.append(path)
+            return code
+
+        self._ids = _PackedStrings(record.id for record in rows)
+        self._names = _PackedStrings(record.name for record in rows)
+        self._icon_urls = array("I", (encode_url(record.icon_url) for record in rows))
+        self._page_urls = array("I", (encode_url(record.page_url) for record in rows))
+        self._paths = _PackedStrings(paths)
+        self._item_types = _Categories(record.item_type for record in rows)
+        self._tiers = _Categories(record.tier for record in rows)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict], base_url: str = "https://www.realmeye.com") -> "ItemCatalog":
+        return cls((ItemRecord(**row) for row in rows), base_url)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[ItemRecord]:
+        return (self.record(row) for row in range(len(self)))
+
+    @property
+    def item_types(self) -> list[str | None]:
+        return list(self._item_types.values)
+
+    @property
+    def tiers(self) -> list[str | None]:
+        return list(self._tiers.values)
+
+    def record(self, row: int) -> ItemRecord:
+        return ItemRecord(
+            id=self._ids[row],
+            name=self._names[row],
+            icon_url=self._url(self._icon_urls[row]),
+            page_url=self._url(self._page_urls[row]),
+            item_type=self._item_types.values[self._item_types.codes[row]],
+            tier=self._tiers.values[self._tiers.codes[row]],
+        )
+
+    def rows(self, item_type: str | None = _ANY, tier: str | None = _ANY) -> list[int]:
+        """Row numbers matching ``item_type`` and/or ``tier``; omitted means any."""
+
+        if item_type is _ANY and tier is _ANY:
+            return list(range(len(self)))
+        if tier is _ANY:
+            return list(self._item_types.rows(item_type))
+        if item_type is _ANY:
+            return list(self._tiers.rows(tier))
+
+        type_rows = self._item_types.rows(item_type)
+        tier_rows = self._tiers.rows(tier)
+        if not type_rows or not tier_rows:
+            return []
+        # Scan the smaller index and check the other column's code.
+        if len(tier_rows) < len(type_rows):
+            type_codes = self._item_types.codes
+            wanted = self._item_types.values.index(item_type)
+            return [row for row in tier_rows if type_codes[row] == wanted]
+        tier_codes = self._tiers.codes
+        wanted = self._tiers.values.index(tier)
+        return [row for row in type_rows if tier_codes[row] == wanted]
+
+    def filter(self, item_type: str | None = _ANY, tier: str | None = _ANY) -> list[ItemRecord]:
+        return [self.record(row) for row in self.rows(item_type, tier)]
+
+    def _url(self, code: int) -> str:
+        path = self._paths[code]
+        return f"{self.base_url}{path}" if path.startswith("/") else path
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+
+def diff_records(previous: list[dict], current: list[dict]) -> dict[str, Any]:
+    """Keyed diff of two normalized record lists.
+
+    ``added`` lists new ids, ``removed`` keeps the full previous row (so
+    consumers can still tell which shard/asset it belonged to) and
+    ``changed`` maps ids to ``{field: [old, new]}``.
+    """
+
+    previous_by_id = {row["id"]: row for row in previous}
+    current_by_id = {row["id"]: row for row in current}
+
+    added = sorted(record_id for record_id in current_by_id if record_id not in previous_by_id)
+    removed = {record_id: previous_by_id[record_id] for record_id in sorted(previous_by_id) if record_id not in current_by_id}
+    changed: dict[str, dict[str, list[Any]]] = {}
+    for record_id in sorted(current_by_id):
+        old = previous_by_id.get(record_id)
+        if old is None:
+            continue
+        new = current_by_id[record_id]
+        fields = {key: [old.get(key), new.get(key)] for key in sorted(old.keys() | new.keys()) if old.get(key) != new.get(key)}
+        if fields:
+            changed[record_id] = fields
+
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def changed_ids(changelog: dict[str, Any]) -> set[str]:
+    """Ids whose current record is new or different; removals are excluded."""
+
+    return set(changelog["added"]) | set(changelog["changed"])
+
+
+def write_records_with_changelog(path: Path, payload: list[dict]) -> dict[str, Any]:
+    """Write ``payload`` to ``path`` plus a ``<name>.changelog.json`` next to it.
+
+    The changelog records the sha256 of the file it was diffed against, so a
+    consumer can tell whether it still describes the delta from its own last
+    build.
+    """
+
+    previous_bytes = path.read_bytes() if path.exists() else b""
+    previous = json.loads(previous_bytes) if previous_bytes else []
+    content = json.dumps(payload, indent=2).encode("utf-8")
+
+    changelog = {
+        "previous_sha256": hashlib.sha256(previous_bytes).hexdigest() if previous_bytes else None,
+        "current_sha256": hashlib.sha256(content).hexdigest(),
+        **diff_records(previous, payload),
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    changelog_path(path).write_text(json.dumps(changelog, indent=2), encoding="utf-8")
+    return changelog
+
+
+def load_changelog(path: Path) -> dict[str, Any] | None:
+    log_path = changelog_path(path)
+    if not log_path.exists():
+        return None
+    return json.loads(log_path.read_text(encoding="utf-8"))
+
+
+def changelog_path(path: Path) -> Path:
+    return path.with_name(f"{path.stem}.changelog.json")
+
+
+def file_sha256(path: Path) -> str | None:
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.models.schema import slugify
+
+INDEX_VERSION = 2
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.9
+MIN_SIMILARITY = 0.2
+# Candidates sort by match tier first; the score only orders within a tier,
+# so a long prefix match never falls behind a short typo neighbour.
+MATCH_TIERS = ("exact", "prefix", "trigram")
+
+
+@dataclass(frozen=True)
+class NameCandidate:
+    id: str
+    name: str
+    kind: str
+    score: float
+    match: str
+
+
+def normalize_name(value: str) -> str:
+    return slugify(value).replace("-", " ")
+
+
+def trigrams(normalized: str) -> set[str]:
+    padded = f"  {normalized} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Resolves free-text names to item/class ids.
+
+    Combines an exact map of normalized names (and ids), a sorted list for
+    prefix lookups and a trigram inverted index for typo-tolerant matches.
+    ``sync`` applies catalog changes incrementally.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str | None] = {}
+        self._entries: dict[str, tuple[str, str]] = {}
+        self._exact: dict[str, set[str]] = {}
+        self._sorted: list[tuple[str, str]] = []
+        self._trigrams: dict[str, set[str]] = {}
+        self._gram_counts: dict[str, int] = {}
+        # Postings read by ``load`` stay as row numbers into ``_row_ids`` until
+        # a query or ``sync`` needs them as id sets.
+        self._row_ids: list[str] = []
+        self._packed_trigrams: dict[str, list[int]] = {}
+
+    @classmethod
+    def build(cls, items: list[dict], classes: list[dict]) -> "NameIndex":
+        index = cls()
+        index.sync(items, classes)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def sync(self, items: list[dict], classes: list[dict]) -> dict[str, int]:
+        """Bring the index in line with the given catalogs; returns change counts."""
+
+        desired = {row["id"]: (row["name"], "item") for row in items}
+        desired.update({row["id"]: (row["name"], "class") for row in classes})
+
+        self._unpack_trigrams()
+        removed = [entry_id for entry_id in self._entries if entry_id not in desired]
+        updated = [entry_id for entry_id, entry in desired.items() if self._entries.get(entry_id) != entry]
+        # All removals run before any addition: _remove bisects _sorted, which
+        # is only re-sorted once after the batch of appends below.
+        for entry_id in [*removed, *(entry_id for entry_id in updated if entry_id in self._entries)]:
+            self._remove(entry_id)
+        for entry_id in updated:
+            self._add(entry_id, *desired[entry_id])
+        if updated:
+            self._sorted.sort()
+        return {"removed": len(removed), "updated": len(updated)}
+
+    def resolve(self, query: str, limit: int = 10, kind: str | None = None) -> list[NameCandidate]:
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        scores: dict[str, tuple[str, float]] = {}
+        for entry_id in self._exact.get(normalized, ()):
+            scores[entry_id] = ("exact", EXACT_SCORE)
+
+        start = bisect_left(self._sorted, (normalized, ""))
+        for name, entry_id in self._sorted[start:]:
+            if not name.startswith(normalized):
+                break
+            # Shorter completions of the prefix rank first.
+            scores.setdefault(entry_id, ("prefix", PREFIX_SCORE * len(normalized) / len(name)))
+
+        query_grams = trigrams(normalized)
+        shared: dict[str, int] = {}
+        for gram in query_grams:
+            for entry_id in self._gram_ids(gram):
+                shared[entry_id] = shared.get(entry_id, 0) + 1
+        for entry_id, count in shared.items():
+            if entry_id in scores:
+                continue
+            similarity = count / (len(query_grams) + self._gram_counts[entry_id] - count)
+            if similarity >= MIN_SIMILARITY:
+                scores[entry_id] = ("trigram", similarity)
+
+        candidates = [
+            NameCandidate(
+                id=entry_id,
+                name=self._entries[entry_id][0],
+                kind=self._entries[entry_id][1],
+                score=round(score, 4),
+                match=match,
+            )
+            for entry_id, (match, score) in scores.items()
+            if kind is None or self._entries[entry_id][1] == kind
+        ]
+        candidates.sort(
+            key=lambda candidate: (
+                MATCH_TIERS.index(candidate.match),
+                -candidate.score,
+                candidate.name.lower(),
+                candidate.id,
+            )
+        )
+        return candidates[:limit]
+
+    def save(self, path: Path) -> None:
+        # Columnar layout: postings and sort order are row numbers instead of
+        # repeated ids, and normalized forms are stored so load skips slugify.
+        self._unpack_trigrams()
+        ids = sorted(self._entries)
+        rows = {entry_id: row for row, entry_id in enumerate(ids)}
+        payload = {
+            "version": INDEX_VERSION,
+            "sources": self.sources,
+            "ids": ids,
+            "names": [self._entries[entry_id][0] for entry_id in ids],
+            "kinds": [self._entries[entry_id][1] for entry_id in ids],
+            "normalized": [normalize_name(self._entries[entry_id][0]) for entry_id in ids],
+            "id_keys": [normalize_name(entry_id) for entry_id in ids],
+            "gram_counts": [self._gram_counts[entry_id] for entry_id in ids],
+            "sorted": [rows[entry_id] for _, entry_id in self._sorted],
+            "trigrams": {gram: sorted(rows[entry_id] for entry_id in entry_ids) for gram, entry_ids in self._trigrams.items()},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "NameIndex":
+        payload: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported name index version in {path}")
+
+        index = cls()
+        index.sources = payload["sources"]
+        ids: list[str] = payload["ids"]
+        normalized: list[str] = payload["normalized"]
+        index._entries = dict(zip(ids, zip(payload["names"], payload["kinds"])))
+        index._gram_counts = dict(zip(ids, payload["gram_counts"]))
+        index._sorted = [(normalized[row], ids[row]) for row in payload["sorted"]]
+        for keys in (normalized, payload["id_keys"]):
+            for key, entry_id in zip(keys, ids):
+                index._exact.setdefault(key, set()).add(entry_id)
+        index._row_ids = ids
+        index._packed_trigrams = payload["trigrams"]
+        return index
+
+    def _gram_ids(self, gram: str) -> set[str]:
+        rows = self._packed_trigrams.pop(gram, None)
+        if rows is not None:
+            self._trigrams[gram] = {self._row_ids[row] for row in rows}
+        return self._trigrams.get(gram, set())
+
+    def _unpack_trigrams(self) -> None:
+        for gram in list(self._packed_trigrams):
+            self._gram_ids(gram)
+
+    def _add(self, entry_id: str, name: str, kind: str) -> None:
+        normalized = normalize_name(name)
+        self._entries[entry_id] = (name, kind)
+        for key in _exact_keys(entry_id, name):
+            self._exact.setdefault(key, set()).add(entry_id)
+        # Callers re-sort once after a batch of additions.
+        self._sorted.append((normalized, entry_id))
+        grams = trigrams(normalized)
+        self._gram_counts[entry_id] = len(grams)
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(entry_id)
+
+    def _remove(self, entry_id: str) -> None:
+        name, _ = self._entries.pop(entry_id)
+        del self._gram_counts[entry_id]
+        normalized = normalize_name(name)
+        for key in _exact_keys(entry_id, name):
+            _discard(self._exact, key, entry_id)
+        position = bisect_left(self._sorted, (normalized, entry_id))
+        if position < len(self._sorted) and self._sorted[position] == (normalized, entry_id):
+            del self._sorted[position]
+        for gram in trigrams(normalized):
+            _discard(self._trigrams, gram, entry_id)
+
+
+def _exact_keys(entry_id: str, name: str) -> set[str]:
+    # Authors often paste a slug or a full id, so index those forms too.
+    return {normalize_name(name), normalize_name(entry_id)}
+
+
+def _discard(index: dict[str, set[str]], key: str, entry_id: str) -> None:
+    ids = index.get(key)
+    if ids is None:
+        return
+    ids.discard(entry_id)
+    if not ids:
+        del index[key]
@@ -38,6 +38,15 @@ class ItemRecord:
     tier: str | None = None
 
 
+@dataclass(frozen=True)
+class ItemDetailRecord:
+    id: str
+    page_url: str
+    fame_bonus: int | None = None
+    feed_power: int | None = None
+    class_restrictions: list[str] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class RequirementRule:
     id: str
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from src.models.schema import AssetRecord, ItemRecord, RequirementsDataset, slugify
+
+MANIFEST_NAME = "manifest.json"
+CORE_SHARD_KEY = "core"
+
+
+def shard_key(item_type: str | None, tier: str | None) -> str:
+    return f"items-{slugify(item_type or 'untyped')}-{slugify(tier or 'untiered')}"
+
+
+def build_shard_payloads(dataset: RequirementsDataset, keys: set[str] | None = None) -> dict[str, dict[str, Any]]:
+    """Split a dataset into independently loadable shards.
+
+    Items (and their assets) are grouped per ``item_type``/``tier``; classes,
+    class assets and requirement rules live in the ``core`` shard. When
+    ``keys`` is given only those shards are materialized.
+    """
+
+    assets_by_id = {asset.id: asset for asset in dataset.assets}
+    groups = _group_items(dataset.items)
+    payloads: dict[str, dict[str, Any]] = {}
+
+    if keys is None or CORE_SHARD_KEY in keys:
+        item_ids = {item.id for item in dataset.items}
+        payloads[CORE_SHARD_KEY] = {
+            "classes": [asdict(record) for record in dataset.classes],
+            "assets": [asdict(asset) for asset_id, asset in assets_by_id.items() if asset_id not in item_ids],
+            "requirements": [asdict(record) for record in dataset.requirements],
+        }
+
+    for key, items in groups.items():
+        if keys is not None and key not in keys:
+            continue
+        payloads[key] = _item_shard_payload(items, assets_by_id)
+
+    return payloads
+
+
+def write_dataset_shards(
+    dataset: RequirementsDataset,
+    output_dir: Path,
+    affected_keys: set[str] | None = None,
+    inputs: dict[str, str | None] | None = None,
+) -> dict[str, Any]:
+    """Write content-addressed shards plus a manifest and return the manifest.
+
+    Shard filenames embed the content hash, so an existing file is never
+    rewritten and clients can cache shards indefinitely. With
+    ``affected_keys``, shards outside that set are carried over from the
+    previous manifest without re-serializing them. ``inputs`` is stored in the
+    manifest so later delta builds can check what it was built from.
+    """
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    current_keys = {CORE_SHARD_KEY, *_group_items(dataset.items)}
+    previous = {entry["key"]: entry for entry in load_manifest(output_dir).get("shards", [])}
+
+    rebuild = current_keys
+    if affected_keys is not None:
+        rebuild = {
+            key
+            for key in current_keys
+            if key in affected_keys or key not in previous or not (output_dir / previous[key]["path"]).exists()
+        }
+
+    entries = {key: previous[key] for key in current_keys - rebuild}
+    for key, payload in build_shard_payloads(dataset, rebuild).items():
+        content = _serialize(payload)
+        checksum = hashlib.sha256(content).hexdigest()
+        filename = f"{key}.{checksum[:16]}.json"
+        shard_path = output_dir / filename
+        if not shard_path.exists():
+            shard_path.write_bytes(content)
+
+        entries[key] = {
+            "key": key,
+            "path": filename,
+            "sha256": checksum,
+            "bytes": len(content),
+            "item_type": payload.get("item_type"),
+            "tier": payload.get("tier"),
+            "count": len(payload.get("items", payload.get("classes", []))),
+        }
+
+    manifest = {
+        "generated_at": dataset.generated_at,
+        "source_urls": dataset.source_urls,
+        "inputs": inputs or {},
+        "shards": [entries[key] for key in sorted(entries, key=_shard_sort_key)],
+    }
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def load_manifest(output_dir: Path) -> dict[str, Any]:
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def _group_items(items: list[ItemRecord]) -> dict[str, list[ItemRecord]]:
+    groups: dict[str, list[ItemRecord]] = {}
+    for item in items:
+        groups.setdefault(shard_key(item.item_type, item.tier), []).append(item)
+    return groups
+
+
+def _item_shard_payload(items: list[ItemRecord], assets_by_id: dict[str, AssetRecord]) -> dict[str, Any]:
+    return {
+        "item_type": items[0].item_type,
+        "tier": items[0].tier,
+        "items": [asdict(item) for item in items],
+        "assets": [asdict(assets_by_id[item.id]) for item in items if item.id in assets_by_id],
+    }
+
+
+def _serialize(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _shard_sort_key(key: str) -> tuple[bool, str]:
+    return (key != CORE_SHARD_KEY, key)
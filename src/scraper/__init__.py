@@ -0,0 +1,2 @@
+# Shared by every fetch path so RealmEye sees one client identity.
+USER_AGENT = "realm-requirements-sheet-bot/0.2"
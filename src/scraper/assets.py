@@ -3,43 +3,92 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING
 
+from src.metrics import METRICS
 from src.models.schema import AssetRecord
+from src.scraper import USER_AGENT
+
+if TYPE_CHECKING:
+    from src.scraper.async_client import AsyncRealmEyeClient
 
 
 class AssetValidationError(RuntimeError):
     pass
 
 
-def download_assets(records: list[dict], output_dir: Path) -> list[AssetRecord]:
+def download_assets(records: list[dict], output_dir: Path, user_agent: str = USER_AGENT) -> list[AssetRecord]:
+    # Imported here so validate-assets doesn't pay for http.client/ssl.
+    from urllib.request import Request, urlopen
+
     output_dir.mkdir(parents=True, exist_ok=True)
     assets: list[AssetRecord] = []
 
     for record in records:
-        entity_id = record["id"]
-        source_url = record["icon_url"]
-        ext = _guess_extension(source_url)
-        local_path = output_dir / f"{entity_id}.{ext}"
-
-        request = Request(source_url, headers={"User-Agent": "realm-requirements-sheet-bot/0.1"})
-        with urlopen(request, timeout=30) as response:
-            content = response.read()
-        local_path.write_bytes(content)
-
-        checksum = hashlib.sha256(content).hexdigest()
-        assets.append(
-            AssetRecord(
-                id=entity_id,
-                source_url=source_url,
-                local_path=str(local_path),
-                checksum_sha256=checksum,
-            )
-        )
+        request = Request(record["icon_url"], headers={"User-Agent": user_agent})
+        with METRICS.timer("assets.download_s"):
+            with urlopen(request, timeout=30) as response:
+                content = response.read()
+        assets.append(_store_asset(record, content, output_dir))
 
     return assets
 
 
+async def download_assets_async(
+    records: list[dict],
+    output_dir: Path,
+    client: AsyncRealmEyeClient,
+    concurrency: int | None = None,
+) -> list[AssetRecord]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    async def fetch(url: str) -> bytes:
+        # Same per-download timer as the sync path, so --metrics-out output
+        # doesn't depend on --async.
+        with METRICS.timer("assets.download_s"):
+            return await client.fetch_bytes(url)
+
+    contents = await client.map_bounded(fetch, [record["icon_url"] for record in records], concurrency)
+    return [_store_asset(record, content, output_dir) for record, content in zip(records, contents)]
+
+
+def records_needing_download(records: list[dict], assets: list[AssetRecord], changed_ids: set[str]) -> list[dict]:
+    """Records whose icon must be (re)downloaded given the current assets.
+
+    ``changed_ids`` comes from the scrape changelogs; records with no asset,
+    a different source URL or a missing file are included as well so a stale
+    changelog never leaves gaps.
+    """
+
+    by_id = {asset.id: asset for asset in assets}
+    selected: list[dict] = []
+    for record in records:
+        asset = by_id.get(record["id"])
+        if (
+            record["id"] in changed_ids
+            or asset is None
+            or asset.source_url != record["icon_url"]
+            or not Path(asset.local_path).exists()
+        ):
+            selected.append(record)
+    return selected
+
+
+def _store_asset(record: dict, content: bytes, output_dir: Path) -> AssetRecord:
+    source_url = record["icon_url"]
+    local_path = output_dir / f"{record['id']}.{_guess_extension(source_url)}"
+    METRICS.incr("assets.downloaded")
+    METRICS.incr("assets.bytes_downloaded", len(content))
+    local_path.write_bytes(content)
+
+    return AssetRecord(
+        id=record["id"],
+        source_url=source_url,
+        local_path=str(local_path),
+        checksum_sha256=hashlib.sha256(content).hexdigest(),
+    )
+
+
 def validate_assets(records: list[dict], assets: list[AssetRecord], report_path: Path) -> dict:
     by_id = {asset.id: asset for asset in assets}
     missing: list[str] = []
@@ -94,27 +143,30 @@ def _guess_extension(url: str) -> str:
 
 
 def _is_supported_image(image_path: Path) -> bool:
-    """Detect image files via magic bytes.
-
-    Python 3.13 removed ``imghdr`` from the stdlib, so we validate using
-    lightweight signature checks for the formats we download.
-    """
-
     try:
         header = image_path.read_bytes()[:16]
     except OSError:
         return False
+    return _sniff_image_type(header) is not None
+
+
+def _sniff_image_type(header: bytes) -> str | None:
+    """Detect image formats via magic bytes.
+
+    Python 3.13 removed ``imghdr`` from the stdlib, so we validate using
+    lightweight signature checks for the formats we download.
+    """
 
     if header.startswith(b"\x89PNG\r\n\x1a\n"):
-        return True
+        return "png"
 
     if header.startswith(b"\xff\xd8\xff"):
-        return True
+        return "jpeg"
 
     if header.startswith((b"GIF87a", b"GIF89a")):
-        return True
+        return "gif"
 
     if len(header) >= 12 and header[:4] == b"RIFF" and header[8:12] == b"WEBP":
-        return True
+        return "webp"
 
-    return False
+    return None
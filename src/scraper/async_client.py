@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
+from urllib.parse import urljoin, urlsplit
+
+from src.metrics import METRICS
+from src.scraper import USER_AGENT
+
+T = TypeVar("T")
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class AsyncHTTPError(OSError):
+    def __init__(self, url: str, status: int) -> None:
+        super().__init__(f"HTTP {status} for {url}")
+        self.url = url
+        self.status = status
+
+
+class AsyncRateLimiter:
+    """Spaces request starts at least ``interval_s`` apart across coroutines."""
+
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        # No await between reading and reserving the slot, so coroutines on
+        # one event loop can't claim the same start time.
+        now = time.monotonic()
+        start_at = max(now, self._next_at)
+        self._next_at = start_at + self.interval_s
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+@dataclass
+class AsyncRealmEyeClient:
+    """asyncio counterpart of ``RealmEyeClient`` built on stdlib streams.
+
+    Retry and backoff semantics match the sync client. Politeness is enforced
+    by one rate limiter shared by every in-flight request (as with
+    ``RealmEyeClient.rate_limiter``), so request starts stay ``polite_delay_s``
+    apart however high the concurrency; concurrency only overlaps latency.
+    Plain sockets are used, so environment proxy settings are not honoured.
+    """
+
+    base_url: str = "https://www.realmeye.com"
+    user_agent: str = USER_AGENT
+    timeout_s: int = 30
+    retries: int = 3
+    backoff_s: float = 1.5
+    polite_delay_s: float = 0.5
+    max_concurrency: int = 16
+    rate_limiter: AsyncRateLimiter | None = field(default=None, repr=False, compare=False)
+    _ssl_context: ssl.SSLContext | None = field(default=None, init=False, repr=False, compare=False)
+
+    async def fetch(self, path_or_url: str) -> str:
+        return (await self.fetch_bytes(path_or_url)).decode("utf-8", errors="replace")
+
+    async def fetch_bytes(self, path_or_url: str) -> bytes:
+        url = path_or_url if path_or_url.startswith("http") else f"{self.base_url}{path_or_url}"
+
+        if self.rate_limiter is None:
+            self.rate_limiter = AsyncRateLimiter(self.polite_delay_s)
+
+        METRICS.incr("fetch.requests")
+        last_error: Exception | None = None
+        for attempt in range(1, self.retries + 1):
+            await self.rate_limiter.acquire()
+            try:
+                with METRICS.timer("fetch.latency_s"):
+                    payload = await asyncio.wait_for(self._get(url), timeout=self.timeout_s)
+                METRICS.incr("fetch.bytes", len(payload))
+                return payload
+            except (OSError, EOFError, ValueError) as exc:
+                last_error = exc
+                if attempt < self.retries:
+                    METRICS.incr("fetch.retries")
+                    await asyncio.sleep(self.backoff_s * attempt)
+
+        METRICS.incr("fetch.failures")
+        raise RuntimeError(f"Failed to fetch {url}.") from last_error
+
+    async def fetch_many(self, paths_or_urls: list[str], concurrency: int | None = None) -> list[str]:
+        return await self.map_bounded(self.fetch, paths_or_urls, concurrency)
+
+    async def fetch_many_bytes(self, paths_or_urls: list[str], concurrency: int | None = None) -> list[bytes]:
+        return await self.map_bounded(self.fetch_bytes, paths_or_urls, concurrency)
+
+    async def map_bounded(
+        self,
+        fetcher: Callable[[str], Awaitable[T]],
+        paths_or_urls: list[str],
+        concurrency: int | None,
+    ) -> list[T]:
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.max_concurrency))
+
+        async def run(path_or_url: str) -> T:
+            async with semaphore:
+                return await fetcher(path_or_url)
+
+        return list(await asyncio.gather(*(run(path_or_url) for path_or_url in paths_or_urls)))
+
+    async def _get(self, url: str) -> bytes:
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers, body = await self._request(url)
+            if status in REDIRECT_STATUSES and "location" in headers:
+                url = urljoin(url, headers["location"])
+                continue
+            if status >= 400:
+                raise AsyncHTTPError(url, status)
+            return body
+        raise AsyncHTTPError(url, status)
+
+    async def _request(self, url: str) -> tuple[int, dict[str, str], bytes]:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported URL {url}")
+
+        is_https = parts.scheme == "https"
+        port = parts.port or (443 if is_https else 80)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        reader, writer = await asyncio.open_connection(
+            parts.hostname,
+            port,
+            ssl=self._tls_context() if is_https else None,
+        )
+        try:
+            writer.write(
+                (
+                    f"GET {target} HTTP/1.1\r\n"
+                    f"Host: {parts.netloc}\r\n"
+                    f"User-Agent: {self.user_agent}\r\n"
+                    "Accept-Encoding: identity\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode("latin-1")
+            )
+            await writer.drain()
+
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+            status_line, *header_lines = head.split("\r\n")
+            status = int(status_line.split(" ", 2)[1])
+            headers: dict[str, str] = {}
+            for line in header_lines:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                body = await _read_chunked(reader)
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                body = await reader.read()
+            return status, headers, body
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _tls_context(self) -> ssl.SSLContext:
+        # Building a context loads the CA bundle, so do it once per client
+        # rather than per request or redirect hop.
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        size_line = await reader.readuntil(b"\r\n")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Skip optional trailers up to the terminating blank line.
+            while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
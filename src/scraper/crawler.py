@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from src.metrics import METRICS
+from src.models.schema import ItemDetailRecord
+from src.scraper.item_details import parse_item_detail_html
+from src.scraper.realmeye_client import RateLimiter, RealmEyeClient
+
+CHECKPOINT_VERSION = 1
+
+
+class CrawlFrontier:
+    """Deduplicated queue of detail pages keyed by page URL.
+
+    Several items can share one page (tiered ring bundles all point at the
+    bundle page), so each URL is fetched once and fanned out to its item ids.
+    """
+
+    def __init__(self) -> None:
+        self._item_ids_by_url: dict[str, list[str]] = {}
+
+    def add(self, page_url: str, item_id: str) -> None:
+        item_ids = self._item_ids_by_url.setdefault(page_url, [])
+        if item_id not in item_ids:
+            item_ids.append(item_id)
+
+    def item_ids(self, page_url: str) -> list[str]:
+        return self._item_ids_by_url.get(page_url, [])
+
+    def pending(self, done: set[str] | dict[str, Any]) -> list[str]:
+        return [url for url in self._item_ids_by_url if url not in done]
+
+    def __len__(self) -> int:
+        return len(self._item_ids_by_url)
+
+
+@dataclass
+class ItemDetailCrawler:
+    client: RealmEyeClient
+    checkpoint_path: Path
+    workers: int = 4
+    checkpoint_every: int = 25
+
+    def crawl(self, items: list[dict]) -> list[ItemDetailRecord]:
+        """Fetch and parse detail pages for ``items``, resuming from the checkpoint.
+
+        Pages already recorded in the checkpoint are not refetched. Failed pages
+        are recorded with their error and retried on the next run.
+        """
+
+        frontier = CrawlFrontier()
+        for item in items:
+            if item.get("page_url"):
+                frontier.add(item["page_url"], item["id"])
+
+        state = self._load_checkpoint()
+        pages: dict[str, dict[str, Any]] = state["pages"]
+        failed: dict[str, str] = state["failed"]
+        pending = frontier.pending(pages)
+        METRICS.incr("crawl.pages_skipped", len(frontier) - len(pending))
+
+        client = self.client
+        if client.rate_limiter is None:
+            client = replace(client, rate_limiter=RateLimiter(client.polite_delay_s))
+
+        completed_since_save = 0
+        executor = ThreadPoolExecutor(max_workers=max(1, self.workers))
+        try:
+            queue = iter(pending)
+            in_flight: dict[Future[str], str] = {}
+            # Keep at most ``workers`` requests queued so an interrupt loses
+            # little work and cancellation is immediate.
+            while True:
+                while len(in_flight) < max(1, self.workers):
+                    page_url = next(queue, None)
+                    if page_url is None:
+                        break
+                    in_flight[executor.submit(client.fetch, page_url)] = page_url
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    page_url = in_flight.pop(future)
+                    try:
+                        html = future.result()
+                    except RuntimeError as exc:
+                        failed[page_url] = str(exc)
+                        METRICS.incr("crawl.pages_failed")
+                        continue
+
+                    detail = parse_item_detail_html(html, frontier.item_ids(page_url)[0], page_url)
+                    pages[page_url] = _page_fields(detail)
+                    failed.pop(page_url, None)
+                    METRICS.incr("crawl.pages_fetched")
+
+                    completed_since_save += 1
+                    if completed_since_save >= self.checkpoint_every:
+                        self._save_checkpoint(state)
+                        completed_since_save = 0
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._save_checkpoint(state)
+
+        records: list[ItemDetailRecord] = []
+        for item in items:
+            fields = pages.get(item.get("page_url", ""))
+            if fields is not None:
+                records.append(ItemDetailRecord(id=item["id"], page_url=item["page_url"], **fields))
+        return sorted(records, key=lambda row: row.id)
+
+    def _load_checkpoint(self) -> dict[str, Any]:
+        if not self.checkpoint_path.exists():
+            return {"version": CHECKPOINT_VERSION, "pages": {}, "failed": {}}
+
+        state = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        if state.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported crawl checkpoint version in {self.checkpoint_path}")
+        state.setdefault("pages", {})
+        state.setdefault("failed", {})
+        return state
+
+    def _save_checkpoint(self, state: dict[str, Any]) -> None:
+        # Write-then-rename so an interrupt never leaves a truncated checkpoint.
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(self.checkpoint_path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def _page_fields(detail: ItemDetailRecord) -> dict[str, Any]:
+    fields = asdict(detail)
+    del fields["id"], fields["page_url"]
+    return fields
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+
+from src.models.schema import ItemDetailRecord, slugify
+from src.scraper.items import CLASS_NAMES
+
+NUMBER_PATTERN = re.compile(r"-?\d[\d,]*")
+FAME_BONUS_LABELS = {"fame bonus"}
+FEED_POWER_LABELS = {"feed power"}
+CLASS_RESTRICTION_LABELS = {"usable by", "classes", "class"}
+
+
+class _DetailTableParser(HTMLParser):
+    """Collects ``label -> value`` rows from item stat tables.
+
+    Each row is ``(label, value_text, value_labels)`` where ``value_labels``
+    holds link texts and image alts from the value cells, which is where
+    RealmEye lists the classes able to use an item.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cells: list[tuple[str, list[str]]] | None = None
+        self._cell_text: list[str] | None = None
+        self._cell_labels: list[str] = []
+        self.rows: list[tuple[str, str, list[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attr_map = {k: (v or "") for k, v in attrs}
+
+        if tag == "tr":
+            self._cells = []
+            return
+
+        if tag in {"td", "th"} and self._cells is not None:
+            self._cell_text = []
+            self._cell_labels = []
+            return
+
+        if tag == "img" and self._cell_text is not None:
+            alt = (attr_map.get("alt") or attr_map.get("title") or "").strip()
+            if alt:
+                self._cell_labels.append(alt)
+            return
+
+        if tag == "a" and self._cell_text is not None:
+            title = (attr_map.get("title") or "").strip()
+            if title:
+                self._cell_labels.append(title)
+
+    def handle_data(self, data: str) -> None:
+        text = data.strip()
+        if text and self._cell_text is not None:
+            self._cell_text.append(text)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in {"td", "th"} and self._cells is not None and self._cell_text is not None:
+            self._cells.append((" ".join(self._cell_text).strip(), self._cell_labels))
+            self._cell_text = None
+            self._cell_labels = []
+            return
+
+        if tag == "tr" and self._cells is not None:
+            if len(self._cells) >= 2:
+                label = self._cells[0][0].rstrip(":").strip().lower()
+                value_text = " ".join(text for text, _ in self._cells[1:]).strip()
+                value_labels = [name for _, names in self._cells[1:] for name in names]
+                self.rows.append((label, value_text, value_labels))
+            self._cells = None
+
+
+def parse_item_detail_html(html: str, item_id: str, page_url: str) -> ItemDetailRecord:
+    parser = _DetailTableParser()
+    parser.feed(html)
+
+    fame_bonus: int | None = None
+    feed_power: int | None = None
+    class_restrictions: list[str] = []
+
+    for label, value_text, value_labels in parser.rows:
+        if label in FAME_BONUS_LABELS and fame_bonus is None:
+            fame_bonus = _first_number(value_text)
+        elif label in FEED_POWER_LABELS and feed_power is None:
+            feed_power = _first_number(value_text)
+        elif label in CLASS_RESTRICTION_LABELS and not class_restrictions:
+            class_restrictions = _class_ids([*value_labels, *re.split(r"[,/]", value_text)])
+
+    return ItemDetailRecord(
+        id=item_id,
+        page_url=page_url,
+        fame_bonus=fame_bonus,
+        feed_power=feed_power,
+        class_restrictions=class_restrictions,
+    )
+
+
+def _first_number(value: str) -> int | None:
+    match = NUMBER_PATTERN.search(value)
+    return int(match.group(0).replace(",", "")) if match else None
+
+
+def _class_ids(candidates: list[str]) -> list[str]:
+    ids: list[str] = []
+    for candidate in candidates:
+        name = candidate.strip().lower()
+        class_id = f"class-{slugify(name)}"
+        if name in CLASS_NAMES and class_id not in ids:
+            ids.append(class_id)
+    return ids
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import re
+import time
 from html.parser import HTMLParser
 
+from src.metrics import METRICS
 from src.models.schema import ItemRecord, slugify
 
 ITEMS_PATH = "/wiki/equipment"
@@ -137,7 +139,14 @@ class _ItemsTableParser(HTMLParser):
 
 def parse_items_html(html: str, base_url: str = "https://www.realmeye.com", default_item_type: str | None = None) -> list[ItemRecord]:
     parser = _ItemsTableParser()
+    started = time.perf_counter()
     parser.feed(html)
+    if METRICS.enabled:
+        elapsed = time.perf_counter() - started
+        METRICS.incr("items.rows_parsed", len(parser.rows))
+        METRICS.observe("items.parse_s", elapsed)
+        if elapsed > 0:
+            METRICS.observe("items.rows_per_s", len(parser.rows) / elapsed)
 
     records: list[ItemRecord] = []
     seen_ids: set[str] = set()
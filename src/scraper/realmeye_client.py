@@ -1,20 +1,44 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.error import HTTPError, URLError
 from urllib.request import ProxyHandler, Request, build_opener
 
+from src.metrics import METRICS
+from src.scraper import USER_AGENT
+
+
+class RateLimiter:
+    """Spaces request starts at least ``interval_s`` apart across threads."""
+
+    def __init__(self, interval_s: float) -> None:
+        self.interval_s = interval_s
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval_s
+        if start_at > now:
+            time.sleep(start_at - now)
+
 
 @dataclass
 class RealmEyeClient:
     base_url: str = "https://www.realmeye.com"
-    user_agent: str = "realm-requirements-sheet-bot/0.2"
+    user_agent: str = USER_AGENT
     timeout_s: int = 30
     retries: int = 3
     backoff_s: float = 1.5
     polite_delay_s: float = 0.5
+    # When set, politeness is enforced by the shared limiter before each
+    # attempt instead of sleeping after every response.
+    rate_limiter: RateLimiter | None = field(default=None, repr=False, compare=False)
 
     def fetch(self, path_or_url: str) -> str:
         url = path_or_url if path_or_url.startswith("http") else f"{self.base_url}{path_or_url}"
@@ -26,18 +50,28 @@ class RealmEyeClient:
         else:
             opener = build_opener()
 
+        METRICS.incr("fetch.requests")
         last_error: Exception | None = None
         for attempt in range(1, self.retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             try:
-                with opener.open(request, timeout=self.timeout_s) as response:
-                    payload = response.read().decode("utf-8", errors="replace")
-                time.sleep(self.polite_delay_s)
+                with METRICS.timer("fetch.latency_s"):
+                    with opener.open(request, timeout=self.timeout_s) as response:
+                        raw = response.read()
+                METRICS.incr("fetch.bytes", len(raw))
+                payload = raw.decode("utf-8", errors="replace")
+                if self.rate_limiter is None:
+                    time.sleep(self.polite_delay_s)
                 return payload
             except (HTTPError, URLError, TimeoutError, OSError) as exc:
                 last_error = exc
                 if attempt < self.retries:
+                    METRICS.incr("fetch.retries")
                     time.sleep(self.backoff_s * attempt)
 
+        METRICS.incr("fetch.failures")
+
         hint = ""
         if last_error and "Tunnel connection failed" in str(last_error):
             hint = " Set REALMEYE_DISABLE_PROXY=1 to bypass proxy environment variables if your network allows direct egress."
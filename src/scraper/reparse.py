@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, astuple, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.models.schema import ClassRecord, ItemRecord
+from src.scraper.classes import parse_classes_html
+from src.scraper.items import CATEGORY_PATHS, parse_items_html
+
+
+@dataclass(frozen=True)
+class SnapshotResult:
+    path: str
+    kind: str | None
+    # Records travel between processes as plain field tuples, which pickle
+    # far smaller than dataclass instances.
+    rows: list[tuple[Any, ...]]
+    elapsed_s: float
+    error: str | None = None
+
+
+def snapshot_kind(path: Path) -> tuple[str | None, str | None]:
+    """Return ``(kind, default_item_type)`` for a raw snapshot filename."""
+
+    name = path.stem
+    if name == "classes":
+        return "classes", None
+    if name.startswith("items-"):
+        item_type = CATEGORY_PATHS.get(f"/wiki/{name.removeprefix('items-')}")
+        if item_type is not None:
+            return "items", item_type
+    return None, None
+
+
+def reparse_snapshot(path: str, base_url: str) -> SnapshotResult:
+    started = time.perf_counter()
+    kind, item_type = snapshot_kind(Path(path))
+    try:
+        if kind is None:
+            return SnapshotResult(path, None, [], time.perf_counter() - started)
+        html = Path(path).read_text(encoding="utf-8")
+        if kind == "classes":
+            records: list[Any] = parse_classes_html(html, base_url)
+        else:
+            records = parse_items_html(html, base_url, default_item_type=item_type)
+        return SnapshotResult(path, kind, [astuple(record) for record in records], time.perf_counter() - started)
+    except Exception as exc:  # reported per file so one bad snapshot doesn't sink the run
+        return SnapshotResult(path, kind, [], time.perf_counter() - started, f"{type(exc).__name__}: {exc}")
+
+
+def _reparse_task(task: tuple[str, str]) -> SnapshotResult:
+    return reparse_snapshot(*task)
+
+
+def reparse_snapshots(
+    paths: list[Path],
+    base_url: str = "https://www.realmeye.com",
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Re-run the parsers over archived snapshots on a process pool.
+
+    Results are merged in sorted path order (later snapshots win on id
+    collisions), so the output does not depend on worker scheduling.
+    """
+
+    tasks = [(str(path), base_url) for path in sorted(paths, key=str)]
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    if workers == 1 or len(tasks) <= 1:
+        results = [_reparse_task(task) for task in tasks]
+    else:
+        # Small chunks keep workers balanced when snapshot sizes vary.
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_reparse_task, tasks, chunksize=chunksize))
+
+    items_by_id: dict[str, ItemRecord] = {}
+    classes_by_id: dict[str, ClassRecord] = {}
+    files: list[dict[str, Any]] = []
+    for result in results:
+        if result.kind == "items":
+            items_by_id.update((row[0], ItemRecord(*row)) for row in result.rows)
+        elif result.kind == "classes":
+            classes_by_id.update((row[0], ClassRecord(*row)) for row in result.rows)
+        files.append(
+            {
+                "path": result.path,
+                "kind": result.kind,
+                "records": len(result.rows),
+                "elapsed_s": round(result.elapsed_s, 6),
+                "error": result.error,
+            }
+        )
+
+    return {
+        "workers": workers,
+        "elapsed_s": round(time.perf_counter() - started, 6),
+        "files": files,
+        "failures": [entry for entry in files if entry["error"]],
+        "items": [asdict(record) for record in sorted(items_by_id.values(), key=lambda row: row.name.lower())],
+        "classes": [asdict(record) for record in sorted(classes_by_id.values(), key=lambda row: row.name.lower())],
+    }
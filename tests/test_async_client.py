@@ -0,0 +1,96 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.metrics import METRICS
+from src.scraper import USER_AGENT
+from src.scraper.assets import download_assets, download_assets_async
+from src.scraper.async_client import AsyncRealmEyeClient, _read_chunked
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8
+
+
+def _client(base_url: str, **overrides) -> AsyncRealmEyeClient:
+    options = {"base_url": base_url, "timeout_s": 5, "retries": 2, "backoff_s": 0, "polite_delay_s": 0}
+    options.update(overrides)
+    return AsyncRealmEyeClient(**options)
+
+
+def test_fetch_many_preserves_order(local_site) -> None:
+    local_site.routes = {f"/wiki/page-{i}": (200, f"page {i}".encode("utf-8")) for i in range(20)}
+    client = _client(local_site.base_url, max_concurrency=4)
+
+    pages = asyncio.run(client.fetch_many([f"/wiki/page-{i}" for i in range(20)]))
+
+    assert pages == [f"page {i}" for i in range(20)]
+
+
+def test_fetch_many_spaces_request_starts(local_site) -> None:
+    local_site.routes = {f"/wiki/page-{i}": (200, b"ok") for i in range(6)}
+    client = _client(local_site.base_url, polite_delay_s=0.05, max_concurrency=6)
+
+    asyncio.run(client.fetch_many([f"/wiki/page-{i}" for i in range(6)]))
+
+    starts = sorted(local_site.request_times)
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert len(starts) == 6
+    assert min(gaps) >= 0.04
+
+
+def test_fetch_retries_then_fails(local_site) -> None:
+    client = _client(local_site.base_url, retries=3)
+
+    with pytest.raises(RuntimeError, match="/wiki/missing"):
+        asyncio.run(client.fetch("/wiki/missing"))
+
+    assert local_site.hits["/wiki/missing"] == 3
+
+
+def test_tls_context_is_created_once_per_client() -> None:
+    client = AsyncRealmEyeClient()
+
+    assert client._tls_context() is client._tls_context()
+    assert AsyncRealmEyeClient()._tls_context() is not client._tls_context()
+
+
+def test_read_chunked_decodes_body() -> None:
+    async def decode() -> bytes:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"5\r\nhello\r\n7;ext=1\r\n, world\r\n0\r\nX-Trailer: 1\r\n\r\n")
+        reader.feed_eof()
+        return await _read_chunked(reader)
+
+    assert asyncio.run(decode()) == b"hello, world"
+
+
+def test_download_assets_async_writes_files(local_site, tmp_path: Path) -> None:
+    local_site.routes = {"/img/sword.png": (200, PNG), "/img/robe.png": (200, PNG)}
+    records = [
+        {"id": "item-sword", "icon_url": f"{local_site.base_url}/img/sword.png"},
+        {"id": "item-robe", "icon_url": f"{local_site.base_url}/img/robe.png"},
+    ]
+
+    assets = asyncio.run(download_assets_async(records, tmp_path, _client(local_site.base_url)))
+
+    assert [asset.id for asset in assets] == ["item-sword", "item-robe"]
+    assert (tmp_path / "item-sword.png").read_bytes() == PNG
+    assert assets[0].checksum_sha256 == assets[1].checksum_sha256
+
+
+def test_sync_and_async_downloads_match(local_site, tmp_path: Path, monkeypatch) -> None:
+    local_site.routes = {"/img/sword.png": (200, PNG)}
+    records = [{"id": "item-sword", "icon_url": f"{local_site.base_url}/img/sword.png"}]
+    monkeypatch.setattr(METRICS, "enabled", True)
+    METRICS.reset()
+    try:
+        download_assets(records, tmp_path / "sync")
+        sync_timings = METRICS.snapshot()["histograms"]["assets.download_s"]["count"]
+        METRICS.reset()
+        asyncio.run(download_assets_async(records, tmp_path / "async", _client(local_site.base_url)))
+        async_timings = METRICS.snapshot()["histograms"]["assets.download_s"]["count"]
+    finally:
+        METRICS.reset()
+
+    assert sync_timings == async_timings == 1
+    assert local_site.user_agents == [USER_AGENT, USER_AGENT]
@@ -0,0 +1,67 @@
+import json
+import tracemalloc
+
+from src.models.catalog import ItemCatalog
+from src.models.schema import ItemRecord
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"item-wisdom-ring-{i}",
+            "name": f"Wisdom Ring {i}",
+            "icon_url": f"https://www.realmeye.com/s/a/img/wiki/i/wisdom-{i // 7}.png",
+            "page_url": f"https://www.realmeye.com/wiki/wisdom-rings-{i // 7}",
+            "item_type": ["Weapon", "Armor", "Ring", "Ability", None][i % 5],
+            "tier": [f"T{i % 15}", "UT", None][i % 3],
+        }
+        for i in range(count)
+    ]
+
+
+def test_catalog_round_trips_records() -> None:
+    records = [ItemRecord(**row) for row in _rows(50)]
+    records.append(ItemRecord("item-cdn", "Cdn Item", "https://cdn.example/img.png", "https://www.realmeye.com/wiki/cdn"))
+
+    catalog = ItemCatalog(records)
+
+    assert len(catalog) == 51
+    assert list(catalog) == records
+    assert catalog.record(50).icon_url == "https://cdn.example/img.png"
+    assert set(catalog.item_types) == {"Weapon", "Armor", "Ring", "Ability", None}
+
+
+def test_catalog_filters_by_type_and_tier() -> None:
+    rows = _rows(300)
+    catalog = ItemCatalog.from_rows(rows)
+
+    def expected(**criteria) -> list[str]:
+        return [row["id"] for row in rows if all(row[key] == value for key, value in criteria.items())]
+
+    assert [record.id for record in catalog.filter(item_type="Ring")] == expected(item_type="Ring")
+    assert [record.id for record in catalog.filter(tier="UT")] == expected(tier="UT")
+    assert [record.id for record in catalog.filter(item_type=None, tier=None)] == expected(item_type=None, tier=None)
+    assert catalog.rows(item_type="Weapon", tier="T3") == [
+        index for index, row in enumerate(rows) if row["item_type"] == "Weapon" and row["tier"] == "T3"
+    ]
+    assert catalog.filter(item_type="Missing", tier="UT") == []
+    assert len(catalog.rows()) == 300
+
+
+def test_catalog_uses_far_less_memory_than_records() -> None:
+    payload = json.dumps(_rows(20_000))
+
+    tracemalloc.start()
+    try:
+        records = [ItemRecord(**row) for row in json.loads(payload)]
+        records_bytes = tracemalloc.get_traced_memory()[0]
+        del records
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        catalog = ItemCatalog.from_rows(json.loads(payload))
+        catalog_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert len(catalog) == 20_000
+    assert catalog_bytes * 3 < records_bytes
@@ -0,0 +1,102 @@
+import argparse
+import json
+from pathlib import Path
+
+import src.cli as cli
+from src.models.changelog import changed_ids, diff_records, load_changelog, write_records_with_changelog
+from src.models.schema import AssetRecord
+from src.scraper import assets as assets_module
+from src.scraper.assets import records_needing_download
+
+
+def _item(item_id: str, tier: str = "T10", icon: str = "sword") -> dict:
+    return {
+        "id": item_id,
+        "name": item_id,
+        "icon_url": f"https://x/{icon}.png",
+        "page_url": f"https://x/{item_id}",
+        "item_type": "Weapon",
+        "tier": tier,
+    }
+
+
+def test_diff_records_reports_added_removed_and_changed_fields() -> None:
+    previous = [_item("item-a"), _item("item-b"), _item("item-c")]
+    current = [_item("item-a"), _item("item-b", tier="T11"), _item("item-d")]
+
+    diff = diff_records(previous, current)
+
+    assert diff["added"] == ["item-d"]
+    assert list(diff["removed"]) == ["item-c"]
+    assert diff["changed"] == {"item-b": {"tier": ["T10", "T11"]}}
+    assert changed_ids(diff) == {"item-b", "item-d"}
+
+
+def test_write_records_with_changelog_tracks_previous_file(tmp_path: Path) -> None:
+    path = tmp_path / "items.json"
+    first = write_records_with_changelog(path, [_item("item-a")])
+    second = write_records_with_changelog(path, [_item("item-a"), _item("item-b")])
+
+    assert first["previous_sha256"] is None
+    assert first["added"] == ["item-a"]
+    assert second["previous_sha256"] == first["current_sha256"]
+    assert second["added"] == ["item-b"]
+    assert load_changelog(path) == second
+
+
+def test_records_needing_download_selects_changed_and_missing(tmp_path: Path) -> None:
+    (tmp_path / "item-a.png").write_bytes(b"png")
+    (tmp_path / "item-b.png").write_bytes(b"png")
+    records = [_item("item-a"), _item("item-b", icon="new"), _item("item-c"), _item("item-d")]
+    assets = [
+        AssetRecord("item-a", "https://x/sword.png", str(tmp_path / "item-a.png")),
+        AssetRecord("item-b", "https://x/sword.png", str(tmp_path / "item-b.png")),
+        AssetRecord("item-c", "https://x/sword.png", str(tmp_path / "missing.png")),
+    ]
+
+    selected = records_needing_download(records, assets, changed_ids=set())
+
+    assert [row["id"] for row in selected] == ["item-b", "item-c", "item-d"]
+
+
+def test_changed_only_build_matches_full_rebuild(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "NORMALIZED_DIR", tmp_path)
+    monkeypatch.setattr(cli, "SHARDS_DIR", tmp_path / "shards")
+    write_records_with_changelog(tmp_path / "classes.json", [])
+    write_records_with_changelog(tmp_path / "assets.json", [])
+    write_records_with_changelog(tmp_path / "items.json", [_item("item-a"), _item("item-b"), _item("item-c", tier="T12")])
+    cli.build_dataset(shards=True)
+
+    write_records_with_changelog(tmp_path / "items.json", [_item("item-a"), _item("item-b", tier="T11"), _item("item-c", tier="T12")])
+    delta = cli.build_dataset(changed_only=True)
+    unchanged_shard = next(entry for entry in delta["shards"] if entry["key"] == "items-weapon-t12")
+    full = cli.build_dataset(shards=True)
+
+    assert [entry["path"] for entry in delta["shards"]] == [entry["path"] for entry in full["shards"]]
+    assert unchanged_shard in full["shards"]
+    t10 = next(entry for entry in delta["shards"] if entry["key"] == "items-weapon-t10")
+    shard = json.loads((tmp_path / "shards" / t10["path"]).read_text(encoding="utf-8"))
+    assert [row["id"] for row in shard["items"]] == ["item-a"]
+
+
+def test_changed_only_download_applies_each_changelog_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "NORMALIZED_DIR", tmp_path)
+    fetched: list[list[str]] = []
+
+    def fake_download(records: list[dict], output_dir: Path) -> list[AssetRecord]:
+        fetched.append([row["id"] for row in records])
+        for row in records:
+            (tmp_path / f"{row['id']}.png").write_bytes(b"png")
+        return [AssetRecord(row["id"], row["icon_url"], str(tmp_path / f"{row['id']}.png")) for row in records]
+
+    monkeypatch.setattr(assets_module, "download_assets", fake_download)
+    args = argparse.Namespace(changed_only=True, use_async=False)
+    write_records_with_changelog(tmp_path / "classes.json", [])
+    write_records_with_changelog(tmp_path / "items.json", [_item("item-a"), _item("item-b")])
+    cli._cmd_download_assets(args)
+
+    write_records_with_changelog(tmp_path / "items.json", [_item("item-a"), _item("item-b", tier="T11"), _item("item-c")])
+    cli._cmd_download_assets(args)
+    cli._cmd_download_assets(args)
+
+    assert fetched == [["item-a", "item-b"], ["item-b", "item-c"], []]
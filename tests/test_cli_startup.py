@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Budgets for what a lightweight subcommand imports beyond a bare interpreter.
+# The module count is deterministic and tracks startup cost: offline commands
+# currently need ~80 modules, and urllib.request alone (http.client, email,
+# ssl, ...) adds ~50. The cumulative `-X importtime` figure swings by 2x
+# between runs on shared CI machines, so its budget is deliberately loose and
+# only catches gross regressions (today it is ~70-80 ms).
+IMPORT_MODULE_BUDGET = int(os.getenv("CLI_IMPORT_MODULE_BUDGET", "90"))
+IMPORT_TIME_BUDGET_US = int(os.getenv("CLI_IMPORT_TIME_BUDGET_US", "400000"))
+NETWORK_MODULES = {"urllib.request", "http.client", "ssl", "asyncio"}
+LAZY_MODULES = NETWORK_MODULES | {
+    "src.scraper.realmeye_client",
+    "src.scraper.items",
+    "src.scraper.classes",
+    "src.scraper.assets",
+    "src.scraper.async_client",
+    "src.models.schema",
+    "html.parser",
+}
+OFFLINE_COMMANDS = {
+    "validate-assets": ["validate-assets"],
+    "build-dataset": ["build-dataset"],
+    "resolve": ["resolve", "wiz"],
+}
+# Runs the real handler through main() with the catalogs redirected.
+RUN_CLI = (
+    "import sys, pathlib, src.cli as cli; "
+    "cli.NORMALIZED_DIR = pathlib.Path(sys.argv[1]); "
+    "cli.main(sys.argv[2:])"
+)
+
+
+def _import_profile(args: list[str]) -> tuple[set[str], int]:
+    """Modules imported by ``python -X importtime <args>`` and the summed
+    cumulative time of top-level imports in microseconds."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported: set[str] = set()
+    top_level_us: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, module = line.removeprefix("import time:").split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        imported.add(module.strip())
+        if not module.startswith("  "):
+            top_level_us[module.strip()] = int(cumulative_us)
+    return imported, sum(top_level_us.values())
+
+
+def _empty_catalogs(path: Path) -> Path:
+    for name in ("classes.json", "items.json", "assets.json"):
+        (path / name).write_text("[]", encoding="utf-8")
+    return path
+
+
+def test_cli_import_defers_subcommand_modules() -> None:
+    imported, _ = _import_profile(["-c", "import src.cli"])
+
+    assert "src.cli" in imported
+    assert not imported & LAZY_MODULES
+
+
+@pytest.mark.parametrize("command", sorted(OFFLINE_COMMANDS))
+def test_offline_commands_skip_network_stack(command: str, tmp_path: Path) -> None:
+    baseline, baseline_us = _import_profile(["-c", "pass"])
+    imported, imported_us = _import_profile(["-c", RUN_CLI, str(_empty_catalogs(tmp_path)), *OFFLINE_COMMANDS[command]])
+
+    assert not imported & NETWORK_MODULES
+    assert len(imported - baseline) <= IMPORT_MODULE_BUDGET
+    assert imported_us - baseline_us <= IMPORT_TIME_BUDGET_US
+
+
+def test_build_parser_registers_all_commands() -> None:
+    from src.cli import COMMANDS, build_parser
+
+    args = build_parser().parse_args(["build-dataset", "--shards"])
+
+    assert args.handler is COMMANDS["build-dataset"][0]
+    assert args.shards is True
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from src.scraper.crawler import CrawlFrontier, ItemDetailCrawler
+from src.scraper.realmeye_client import RealmEyeClient
+
+
+def _detail_page(fame_bonus: int) -> bytes:
+    return f"<table><tr><th>Fame Bonus</th><td>{fame_bonus}%</td></tr></table>".encode("utf-8")
+
+
+def _items(base_url: str) -> list[dict]:
+    return [
+        {"id": "item-sword", "page_url": f"{base_url}/wiki/sword"},
+        {"id": "item-robe", "page_url": f"{base_url}/wiki/robe"},
+        {"id": "item-wisdom-rings-t1", "page_url": f"{base_url}/wiki/wisdom-rings"},
+        {"id": "item-wisdom-rings-t2", "page_url": f"{base_url}/wiki/wisdom-rings"},
+    ]
+
+
+def _client(base_url: str) -> RealmEyeClient:
+    return RealmEyeClient(base_url=base_url, timeout_s=5, retries=1, backoff_s=0, polite_delay_s=0)
+
+
+def test_frontier_dedupes_shared_pages() -> None:
+    frontier = CrawlFrontier()
+    frontier.add("https://x/wisdom-rings", "item-wisdom-rings-t1")
+    frontier.add("https://x/wisdom-rings", "item-wisdom-rings-t2")
+    frontier.add("https://x/wisdom-rings", "item-wisdom-rings-t2")
+
+    assert len(frontier) == 1
+    assert frontier.item_ids("https://x/wisdom-rings") == ["item-wisdom-rings-t1", "item-wisdom-rings-t2"]
+    assert frontier.pending({"https://x/wisdom-rings"}) == []
+
+
+def test_crawl_fetches_each_page_once(local_site, tmp_path: Path) -> None:
+    local_site.routes = {
+        "/wiki/sword": (200, _detail_page(5)),
+        "/wiki/robe": (200, _detail_page(3)),
+        "/wiki/wisdom-rings": (200, _detail_page(1)),
+    }
+    crawler = ItemDetailCrawler(_client(local_site.base_url), tmp_path / "checkpoint.json", workers=3)
+
+    records = crawler.crawl(_items(local_site.base_url))
+
+    assert [(row.id, row.fame_bonus) for row in records] == [
+        ("item-robe", 3),
+        ("item-sword", 5),
+        ("item-wisdom-rings-t1", 1),
+        ("item-wisdom-rings-t2", 1),
+    ]
+    assert set(local_site.hits.values()) == {1}
+
+
+def test_crawl_resumes_without_refetching(local_site, tmp_path: Path) -> None:
+    checkpoint = tmp_path / "checkpoint.json"
+    local_site.routes = {
+        "/wiki/sword": (200, _detail_page(5)),
+        "/wiki/wisdom-rings": (200, _detail_page(1)),
+    }
+    crawler = ItemDetailCrawler(_client(local_site.base_url), checkpoint, workers=2)
+
+    first = crawler.crawl(_items(local_site.base_url))
+    state = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert "item-robe" not in {row.id for row in first}
+    assert list(state["failed"]) == [f"{local_site.base_url}/wiki/robe"]
+
+    local_site.routes["/wiki/robe"] = (200, _detail_page(3))
+    second = crawler.crawl(_items(local_site.base_url))
+
+    assert len(second) == 4
+    assert local_site.hits["/wiki/sword"] == 1
+    assert local_site.hits["/wiki/wisdom-rings"] == 1
+    assert local_site.hits["/wiki/robe"] == 2
+    assert json.loads(checkpoint.read_text(encoding="utf-8"))["failed"] == {}
@@ -0,0 +1,42 @@
+import json
+import pstats
+from pathlib import Path
+
+from src.metrics import MetricsRegistry, profile_to
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry()
+    registry.incr("fetch.requests")
+    registry.observe("fetch.latency_s", 0.5)
+    with registry.timer("dataset.serialize_s"):
+        pass
+
+    assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_enabled_registry_summarizes_counters_and_histograms(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    registry.enable()
+    registry.incr("assets.bytes_downloaded", 100)
+    registry.incr("assets.bytes_downloaded", 50)
+    for value in (3.0, 1.0, 2.0):
+        registry.observe("fetch.latency_s", value)
+    with registry.timer("dataset.serialize_s"):
+        pass
+
+    registry.write_json(tmp_path / "metrics.json")
+    snapshot = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+
+    assert snapshot["counters"] == {"assets.bytes_downloaded": 150}
+    latency = snapshot["histograms"]["fetch.latency_s"]
+    assert (latency["count"], latency["min"], latency["max"], latency["p50"]) == (3, 1.0, 3.0, 2.0)
+    assert snapshot["histograms"]["dataset.serialize_s"]["count"] == 1
+
+
+def test_profile_to_writes_loadable_stats(tmp_path: Path) -> None:
+    stats_path = tmp_path / "stage.prof"
+    with profile_to(stats_path):
+        sorted(range(1000), reverse=True)
+
+    assert pstats.Stats(str(stats_path)).total_calls > 0
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import src.cli as cli
+from src.models.name_index import NameIndex
+
+ITEMS = [
+    {"id": "item-tiered-sword", "name": "Tiered Sword"},
+    {"id": "item-tiered-staff", "name": "Tiered Staff"},
+    {"id": "item-tiered-robe", "name": "Tiered Robe"},
+    {"id": "item-wisdom-rings-t1", "name": "Wisdom Rings (T1)"},
+]
+CLASSES = [{"id": "class-knight", "name": "Knight"}, {"id": "class-wizard", "name": "Wizard"}]
+
+
+def test_resolve_ranks_exact_prefix_and_fuzzy_matches() -> None:
+    index = NameIndex.build(ITEMS, CLASSES)
+
+    assert index.resolve("tiered sword")[0].id == "item-tiered-sword"
+    assert index.resolve("item-tiered-robe")[0].id == "item-tiered-robe"
+    assert [c.id for c in index.resolve("tiered st")][:1] == ["item-tiered-staff"]
+    assert index.resolve("teired swrod")[0].id == "item-tiered-sword"
+    assert index.resolve("wisdom rings t1")[0].score == 1.0
+    assert [c.id for c in index.resolve("wiz", kind="class")] == ["class-wizard"]
+
+
+def test_prefix_matches_outrank_shorter_trigram_neighbours() -> None:
+    items = [
+        {"id": "item-staff-of-extreme-prejudice", "name": "Staff of Extreme Prejudice"},
+        {"id": "item-stuff", "name": "Stuff"},
+        {"id": "item-wand-of-the-bulwark", "name": "Wand of the Bulwark"},
+        {"id": "item-wane", "name": "Wane"},
+    ]
+    index = NameIndex.build(items, [])
+
+    staff = index.resolve("staff")
+    wand = index.resolve("wand")
+
+    assert [c.id for c in staff] == ["item-staff-of-extreme-prejudice", "item-stuff"]
+    assert [c.match for c in staff] == ["prefix", "trigram"]
+    assert staff[0].score < staff[1].score
+    assert [c.id for c in wand][:2] == ["item-wand-of-the-bulwark", "item-wane"]
+
+
+def test_sync_applies_renames_and_removals() -> None:
+    index = NameIndex.build(ITEMS, CLASSES)
+    renamed = [{"id": "item-tiered-sword", "name": "Fabled Blade"}, *ITEMS[1:3]]
+
+    assert index.sync(renamed, CLASSES) == {"removed": 1, "updated": 1}
+    assert len(index) == 5
+    assert index.resolve("fabled blade")[0].id == "item-tiered-sword"
+    assert all(c.id != "item-wisdom-rings-t1" for c in index.resolve("wisdom rings"))
+    assert all(c.score < 1.0 for c in index.resolve("tiered sword"))
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    index = NameIndex.build(ITEMS, CLASSES)
+    index.save(tmp_path / "name-index.json")
+    loaded = NameIndex.load(tmp_path / "name-index.json")
+
+    for query in ("tiered", "knigth", "item-tiered-staff"):
+        assert loaded.resolve(query) == index.resolve(query)
+    loaded._unpack_trigrams()
+    assert loaded._trigrams == index._trigrams
+    assert loaded._exact == index._exact
+    assert loaded._sorted == index._sorted
+    assert loaded._gram_counts == index._gram_counts
+    loaded.sync([*ITEMS, {"id": "item-tiered-bow", "name": "Tiered Bow"}], CLASSES)
+    assert loaded.resolve("tiered bow")[0].id == "item-tiered-bow"
+
+
+def test_load_name_index_rebuilds_when_catalog_changes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "NORMALIZED_DIR", tmp_path)
+    (tmp_path / "items.json").write_text(json.dumps(ITEMS), encoding="utf-8")
+    (tmp_path / "classes.json").write_text(json.dumps(CLASSES), encoding="utf-8")
+
+    assert cli.load_name_index().resolve("tiered robe")[0].id == "item-tiered-robe"
+    assert (tmp_path / "name-index.json").exists()
+
+    (tmp_path / "items.json").write_text(json.dumps([{"id": "item-tiered-bow", "name": "Tiered Bow"}]), encoding="utf-8")
+    index = cli.load_name_index()
+
+    assert len(index) == 3
+    assert index.resolve("tiered bow")[0].id == "item-tiered-bow"
+
+
+def test_load_name_index_rebuilds_outdated_index_file(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cli, "NORMALIZED_DIR", tmp_path)
+    (tmp_path / "items.json").write_text(json.dumps(ITEMS), encoding="utf-8")
+    (tmp_path / "classes.json").write_text(json.dumps(CLASSES), encoding="utf-8")
+    (tmp_path / "name-index.json").write_text(json.dumps({"version": 1}), encoding="utf-8")
+
+    assert cli.load_name_index().resolve("tiered robe")[0].id == "item-tiered-robe"
+    assert NameIndex.load(tmp_path / "name-index.json").resolve("knight")[0].id == "class-knight"
+
+
+def test_incremental_sync_matches_fresh_build() -> None:
+    import random
+
+    rng = random.Random(7)
+    words = ["alpha", "beta", "gamma", "rho", "sigma", "tau", "omega", "zeta"]
+
+    def catalog() -> list[dict]:
+        ids = rng.sample(range(40), 25)
+        return [{"id": f"item-{i}", "name": " ".join(rng.sample(words, 2))} for i in ids]
+
+    for _ in range(200):
+        before, after = catalog(), catalog()
+        index = NameIndex.build(before, CLASSES)
+        index.sync(after, CLASSES)
+        fresh = NameIndex.build(after, CLASSES)
+
+        assert index._sorted == fresh._sorted
+        assert index._exact == fresh._exact
+        assert index._trigrams == fresh._trigrams
+        for query in ("rho alpha", "sigma", "omga tau"):
+            assert index.resolve(query) == fresh.resolve(query)
+
+
+def test_sync_rename_after_added_id_that_sorts_first() -> None:
+    index = NameIndex.build([{"id": "item-13", "name": "Rho Alpha"}], [])
+    index.sync([{"id": "item-1", "name": "Aaa First"}, {"id": "item-13", "name": "Sigma Rho"}], [])
+
+    assert all(c.id != "item-13" or c.score < 0.9 for c in index.resolve("rho alpha"))
+    index.sync([{"id": "item-1", "name": "Aaa First"}], [])
+    assert [c.id for c in index.resolve("rho alpha")] == []
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from src.scraper.classes import parse_classes_html
+from src.scraper.item_details import parse_item_detail_html
 from src.scraper.items import parse_items_html
 
 
@@ -96,3 +97,18 @@ def test_parse_items_html_reads_ut_st_from_named_sections() -> None:
 
     assert by_id["item-the-twilight-gemstone"].tier == "UT"
     assert by_id["item-yokai-amulet"].tier == "ST"
+
+
+def test_parse_item_detail_html_extracts_stats_and_classes() -> None:
+    html = Path("tests/fixtures/item_details/sample_item_detail.html").read_text(encoding="utf-8")
+    record = parse_item_detail_html(html, "item-tiered-sword", "https://www.realmeye.com/wiki/tiered-sword")
+
+    assert record.fame_bonus == 5
+    assert record.feed_power == 1200
+    assert record.class_restrictions == ["class-knight", "class-warrior", "class-paladin"]
+
+
+def test_parse_item_detail_html_tolerates_missing_stats() -> None:
+    record = parse_item_detail_html("<html><body><p>Stub</p></body></html>", "item-x", "https://x/item-x")
+
+    assert (record.fame_bonus, record.feed_power, record.class_restrictions) == (None, None, [])
@@ -0,0 +1,48 @@
+import shutil
+from pathlib import Path
+
+from src.scraper.reparse import reparse_snapshots, snapshot_kind
+
+FIXTURES = Path("tests/fixtures")
+
+
+def _archive(root: Path) -> list[Path]:
+    for day in ("2026-01-01", "2026-02-01"):
+        (root / day).mkdir(parents=True)
+        shutil.copy(FIXTURES / "classes/sample_classes.html", root / day / "classes.html")
+        shutil.copy(FIXTURES / "items/sample_items.html", root / day / "items-weapons.html")
+        (root / day / "items-index.html").write_text("<html></html>", encoding="utf-8")
+    (root / "2026-02-01" / "items-armor.html").write_bytes(b"\xff\xfe<html>")
+    return sorted(root.rglob("*.html"))
+
+
+def test_snapshot_kind_uses_filename() -> None:
+    assert snapshot_kind(Path("raw/classes.html")) == ("classes", None)
+    assert snapshot_kind(Path("raw/items-ability-items.html")) == ("items", "Ability")
+    assert snapshot_kind(Path("raw/items-index.html")) == (None, None)
+
+
+def test_reparse_snapshots_merges_and_reports_failures(tmp_path: Path) -> None:
+    paths = _archive(tmp_path)
+
+    report = reparse_snapshots(paths, workers=1)
+
+    assert [row["id"] for row in report["classes"]] == ["class-knight", "class-wizard"]
+    assert [row["id"] for row in report["items"]] == ["item-tiered-robe", "item-tiered-sword"]
+    assert {row["item_type"] for row in report["items"]} == {"Weapon"}
+    assert [Path(entry["path"]).name for entry in report["failures"]] == ["items-armor.html"]
+    assert "UnicodeDecodeError" in report["failures"][0]["error"]
+    assert len(report["files"]) == len(paths)
+
+
+def test_reparse_snapshots_process_pool_matches_serial(tmp_path: Path) -> None:
+    paths = _archive(tmp_path)
+
+    serial = reparse_snapshots(paths, workers=1)
+    pooled = reparse_snapshots(list(reversed(paths)), workers=2)
+
+    for key in ("items", "classes"):
+        assert pooled[key] == serial[key]
+    assert [(entry["path"], entry["records"], entry["error"]) for entry in pooled["files"]] == [
+        (entry["path"], entry["records"], entry["error"]) for entry in serial["files"]
+    ]
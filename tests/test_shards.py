@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+
+from src.models.schema import AssetRecord, ClassRecord, ItemRecord, RequirementsDataset
+from src.models.shards import MANIFEST_NAME, shard_key, write_dataset_shards
+
+
+def _dataset() -> RequirementsDataset:
+    return RequirementsDataset.new(
+        source_urls=["https://www.realmeye.com/wiki/items"],
+        classes=[ClassRecord("class-knight", "Knight", "https://x/knight.png", "https://x/knight")],
+        items=[
+            ItemRecord("item-sword", "Sword", "https://x/sword.png", "https://x/sword", "Weapon", "T14"),
+            ItemRecord("item-robe", "Robe", "https://x/robe.png", "https://x/robe", "Armor", "T5"),
+            ItemRecord("item-heart", "Heart", "https://x/heart.png", "https://x/heart", "Ring", None),
+        ],
+        assets=[
+            AssetRecord("class-knight", "https://x/knight.png", "knight.png", "a"),
+            AssetRecord("item-sword", "https://x/sword.png", "sword.png", "b"),
+        ],
+        requirements=[],
+    )
+
+
+def test_write_dataset_shards_groups_items_by_type_and_tier(tmp_path: Path) -> None:
+    manifest = write_dataset_shards(_dataset(), tmp_path)
+    by_key = {entry["key"]: entry for entry in manifest["shards"]}
+
+    assert manifest["shards"][0]["key"] == "core"
+    assert set(by_key) == {
+        "core",
+        shard_key("Weapon", "T14"),
+        shard_key("Armor", "T5"),
+        "items-ring-untiered",
+    }
+
+    weapons = by_key["items-weapon-t14"]
+    content = (tmp_path / weapons["path"]).read_bytes()
+    assert len(content) == weapons["bytes"]
+    assert weapons["sha256"][:16] in weapons["path"]
+
+    shard = json.loads(content)
+    assert [row["id"] for row in shard["items"]] == ["item-sword"]
+    assert [row["id"] for row in shard["assets"]] == ["item-sword"]
+
+    core = json.loads((tmp_path / by_key["core"]["path"]).read_text(encoding="utf-8"))
+    assert [row["id"] for row in core["assets"]] == ["class-knight"]
+    assert json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8")) == manifest
+
+
+def test_write_dataset_shards_is_stable_across_runs(tmp_path: Path) -> None:
+    first = write_dataset_shards(_dataset(), tmp_path)
+    second = write_dataset_shards(_dataset(), tmp_path)
+
+    assert [entry["path"] for entry in first["shards"]] == [entry["path"] for entry in second["shards"]]
+    assert len(list(tmp_path.glob("*.json"))) == len(first["shards"]) + 1